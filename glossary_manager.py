@@ -8,14 +8,55 @@ are not yet available in the current Google Cloud Translation v3 library.
 """
 
 import argparse
+import functools
 import json
+import logging
 import os
 import sys
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 import requests
-from google.oauth2 import service_account
-from google.auth.transport.requests import Request
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds before the reported expiry at which an access token is refreshed
+TOKEN_EXPIRY_SKEW = 60
+
+
+@functools.lru_cache(maxsize=8)
+def _load_credentials(auth_file: str):
+    """
+    Load service account credentials, reusing them for repeated auth files.
+
+    Managers built from the same file share one credentials object, so the key
+    is parsed once and an access token minted by one is reused by the others.
+
+    Args:
+        auth_file: Path to the service account JSON file
+
+    Returns:
+        Service account credentials scoped for Cloud Platform
+    """
+    # Imported here so that --help and argument errors don't pay for google-auth
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
+        auth_file,
+        scopes=['https://www.googleapis.com/auth/cloud-platform']
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _credentials_lock(auth_file: str) -> threading.Lock:
+    """Return the lock that serialises token refreshes for one auth file's credentials."""
+    return threading.Lock()
+
+
+class IncompleteListingError(Exception):
+    """Raised when listing glossary entries fails after some pages were returned."""
 
 
 class GlossaryEntryManager:
@@ -33,12 +74,14 @@ class GlossaryEntryManager:
         self.project_id = project_id
         self.location = location
         self.auth_file = auth_file
+        self.logger = logging.getLogger(__name__)
 
         # Set up authentication
-        self.credentials = service_account.Credentials.from_service_account_file(
-            auth_file,
-            scopes=['https://www.googleapis.com/auth/cloud-platform']
-        )
+        self.credentials = _load_credentials(auth_file)
+        self._refresh_lock = _credentials_lock(auth_file)
+        self._cached_headers: Dict[str, str] = {}
+        self._cached_token: Optional[str] = None
+        self._token_expiry = 0.0
 
         # Base URL for the Translation API
         self.base_url = "https://translation.googleapis.com/v3"
@@ -46,61 +89,133 @@ class GlossaryEntryManager:
         # Construct the parent path
         self.parent = f"projects/{project_id}/locations/{location}"
 
+        # Prefix shared by every glossary URL, built once
+        self.glossaries_url = f"{self.base_url}/{self.parent}/glossaries"
+
+        # Reuse connections across API calls; retry transient errors on idempotent requests
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                        raise_on_status=False)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+
+    def _entries_url(self, glossary_id: str, entry_id: Optional[str] = None) -> str:
+        """Build the glossaryEntries URL, or a single entry's URL when entry_id is given."""
+        url = f"{self.glossaries_url}/{glossary_id}/glossaryEntries"
+        if entry_id is None:
+            return url
+
+        # An empty ID would otherwise address the collection itself
+        if not entry_id:
+            raise ValueError("Glossary entry ID must not be empty")
+        return f"{url}/{entry_id}"
+
     def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        # Refresh the token if needed
-        if not self.credentials.valid:
-            self.credentials.refresh(Request())
+        """Get headers for API requests. The returned dict is shared; don't modify it."""
+        # Refresh the token if needed; a float compare avoids the datetime
+        # arithmetic behind credentials.valid on every call
+        if time.time() >= self._token_expiry:
+            # Credentials are shared between managers and threads; only one refreshes,
+            # the rest find them valid once they get the lock
+            with self._refresh_lock:
+                if not self.credentials.valid:
+                    from google.auth.transport.requests import Request
+                    self.credentials.refresh(Request(session=self.session))
+
+                expiry = self.credentials.expiry
+
+            self._token_expiry = (
+                expiry.replace(tzinfo=timezone.utc).timestamp() - TOKEN_EXPIRY_SKEW
+                if expiry else float("inf")
+            )
 
-        return {
-            "Authorization": f"Bearer {self.credentials.token}",
-            "Content-Type": "application/json; charset=utf-8",
-            "x-goog-user-project": self.project_id
-        }
+        # Rebuild the headers only when the access token has changed
+        token = self.credentials.token
+        if token != self._cached_token:
+            self._cached_headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json; charset=utf-8",
+                "x-goog-user-project": self.project_id
+            }
+            self._cached_token = token
 
-    def list_glossary_entries(self, glossary_id: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        return self._cached_headers
+
+    def iter_glossary_entries(self, glossary_id: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
         """
-        List all entries in a glossary.
+        Iterate over all entries in a glossary, fetching pages as they are consumed.
 
         Args:
             glossary_id: The ID of the glossary
-            page_size: Number of entries to return per page (default: 100)
+            page_size: Number of entries to request per page (default: 100)
 
-        Returns:
-            List of glossary entries as dictionaries
+        Yields:
+            Glossary entries as dictionaries
+
+        Raises:
+            IncompleteListingError: If a page after the first one fails
         """
+        # Construct the URL
+        url = self._entries_url(glossary_id)
+
+        # Add query parameters
+        params = {"pageSize": page_size}
+
         try:
-            # Construct the URL
-            url = f"{self.base_url}/{self.parent}/glossaries/{glossary_id}/glossaryEntries"
+            self.logger.info("Listing glossary entries for glossary: %s", glossary_id)
+            self.logger.debug("URL: %s", url)
+
+            while True:
+                # Make the API call
+                response = self.session.get(url, headers=self._get_headers(), params=params)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    yield from data.get("glossaryEntries", [])
+
+                    # Follow the opaque cursor until the last page
+                    page_token = data.get("nextPageToken")
+                    if not page_token:
+                        return
+                    params["pageToken"] = page_token
+                elif response.status_code == 404:
+                    self.logger.error("Glossary '%s' not found", glossary_id)
+                    break
+                elif response.status_code == 403:
+                    self.logger.error("Permission denied. Check your service account permissions.")
+                    break
+                else:
+                    self.logger.error("HTTP %s - %s", response.status_code, response.text)
+                    break
 
-            # Add query parameters
-            params = {"pageSize": page_size}
+        except Exception as e:
+            self.logger.error("Error listing glossary entries: %s", e)
 
-            print(f"Listing glossary entries for glossary: {glossary_id}")
-            print(f"URL: {url}")
+        # Earlier pages were already yielded; don't let them pass for the whole glossary
+        if "pageToken" in params:
+            raise IncompleteListingError(
+                f"Listing of glossary '{glossary_id}' failed before the last page"
+            )
 
-            # Make the API call
-            response = requests.get(url, headers=self._get_headers(), params=params)
+    def list_glossary_entries(self, glossary_id: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        List all entries in a glossary.
 
-            if response.status_code == 200:
-                data = response.json()
-                entries = data.get("glossaryEntries", [])
-                print(f"Found {len(entries)} glossary entries")
-                return entries
-            elif response.status_code == 404:
-                print(f"Error: Glossary '{glossary_id}' not found")
-                return []
-            elif response.status_code == 403:
-                print(f"Error: Permission denied. Check your service account permissions.")
-                return []
-            else:
-                print(f"Error: HTTP {response.status_code} - {response.text}")
-                return []
+        Args:
+            glossary_id: The ID of the glossary
+            page_size: Number of entries to request per page (default: 100)
 
-        except Exception as e:
-            print(f"Error listing glossary entries: {e}")
+        Returns:
+            List of glossary entries as dictionaries; empty if any page failed
+        """
+        try:
+            entries = list(self.iter_glossary_entries(glossary_id, page_size))
+        except IncompleteListingError as e:
+            self.logger.error("%s", e)
             return []
 
+        self.logger.info("Found %d glossary entries", len(entries))
+        return entries
+
     def get_glossary_entry(self, glossary_id: str, entry_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific glossary entry by ID.
@@ -114,27 +229,27 @@ class GlossaryEntryManager:
         """
         try:
             # Construct the URL
-            url = f"{self.base_url}/{self.parent}/glossaries/{glossary_id}/glossaryEntries/{entry_id}"
+            url = self._entries_url(glossary_id, entry_id)
 
-            print(f"Getting glossary entry: {entry_id}")
-            print(f"URL: {url}")
+            self.logger.info("Getting glossary entry: %s", entry_id)
+            self.logger.debug("URL: %s", url)
 
             # Make the API call
-            response = requests.get(url, headers=self._get_headers())
+            response = self.session.get(url, headers=self._get_headers())
 
             if response.status_code == 200:
                 entry = response.json()
-                print(f"Retrieved entry: {entry_id}")
+                self.logger.info("Retrieved entry: %s", entry_id)
                 return entry
             elif response.status_code == 404:
-                print(f"Error: Glossary entry '{entry_id}' not found")
+                self.logger.error("Glossary entry '%s' not found", entry_id)
                 return None
             else:
-                print(f"Error: HTTP {response.status_code} - {response.text}")
+                self.logger.error("HTTP %s - %s", response.status_code, response.text)
                 return None
 
         except Exception as e:
-            print(f"Error getting glossary entry: {e}")
+            self.logger.error("Error getting glossary entry: %s", e)
             return None
 
     def create_glossary_entry(self, glossary_id: str, terms: List[Dict[str, str]],
@@ -152,7 +267,7 @@ class GlossaryEntryManager:
         """
         try:
             # Construct the URL
-            url = f"{self.base_url}/{self.parent}/glossaries/{glossary_id}/glossaryEntries"
+            url = self._entries_url(glossary_id)
 
             # Prepare the request body - try termsPair first for unidirectional glossaries
             request_body = {}
@@ -182,28 +297,30 @@ class GlossaryEntryManager:
             if description:
                 request_body["description"] = description
 
-            print(f"Creating glossary entry in glossary: {glossary_id}")
-            print(f"URL: {url}")
-            print(f"Request body: {json.dumps(request_body, indent=2)}")
+            self.logger.info("Creating glossary entry in glossary: %s", glossary_id)
+            self.logger.debug("URL: %s", url)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Request body: %s", json.dumps(request_body, indent=2))
 
             # Make the API call
-            response = requests.post(url, headers=self._get_headers(), json=request_body)
+            response = self.session.post(url, headers=self._get_headers(), json=request_body)
 
             if response.status_code == 200:
                 entry = response.json()
-                entry_id = entry["name"].split("/")[-1]
-                print(f"Created glossary entry: {entry_id}")
+                entry_id = entry["name"].rpartition("/")[2]
+                self.logger.info("Created glossary entry: %s", entry_id)
                 return entry_id
             else:
-                print(f"Error: HTTP {response.status_code} - {response.text}")
+                self.logger.error("HTTP %s - %s", response.status_code, response.text)
                 return None
 
         except Exception as e:
-            print(f"Error creating glossary entry: {e}")
+            self.logger.error("Error creating glossary entry: %s", e)
             return None
 
     def update_glossary_entry(self, glossary_id: str, entry_id: str,
-                            terms: List[Dict[str, str]], description: str = "") -> bool:
+                            terms: List[Dict[str, str]], description: str = "",
+                            existing_entry: Optional[Dict[str, Any]] = None) -> bool:
         """
         Update an existing glossary entry.
 
@@ -212,19 +329,22 @@ class GlossaryEntryManager:
             entry_id: The ID of the glossary entry
             terms: List of terms with language_code and text
             description: Description of the glossary entry
+            existing_entry: The entry as already fetched by the caller, if any;
+                skips the lookup used to determine the entry format
 
         Returns:
             True if successful, False otherwise
         """
         try:
             # First, get the existing entry to determine its format
-            existing_entry = self.get_glossary_entry(glossary_id, entry_id)
+            if existing_entry is None:
+                existing_entry = self.get_glossary_entry(glossary_id, entry_id)
             if not existing_entry:
-                print(f"Error: Cannot find existing entry {entry_id} to determine format")
+                self.logger.error("Cannot find existing entry %s to determine format", entry_id)
                 return False
 
             # Construct the URL
-            url = f"{self.base_url}/{self.parent}/glossaries/{glossary_id}/glossaryEntries/{entry_id}"
+            url = self._entries_url(glossary_id, entry_id)
 
             # Prepare the request body based on the existing entry format
             request_body = {}
@@ -248,7 +368,7 @@ class GlossaryEntryManager:
                         }
                     }
                 else:
-                    print("Error: Need at least 2 terms for termsPair format")
+                    self.logger.error("Need at least 2 terms for termsPair format")
                     return False
             else:
                 # Use termsSet format
@@ -259,23 +379,23 @@ class GlossaryEntryManager:
             if description:
                 request_body["description"] = description
 
-            print(f"Updating glossary entry: {entry_id}")
-            print(f"URL: {url}")
-            print(f"Request body: {json.dumps(request_body, indent=2)}")
+            self.logger.info("Updating glossary entry: %s", entry_id)
+            self.logger.debug("URL: %s", url)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Request body: %s", json.dumps(request_body, indent=2))
 
             # Make the API call
-            response = requests.patch(url, headers=self._get_headers(), json=request_body)
+            response = self.session.patch(url, headers=self._get_headers(), json=request_body)
 
             if response.status_code == 200:
-                entry = response.json()
-                print(f"Updated glossary entry: {entry_id}")
+                self.logger.info("Updated glossary entry: %s", entry_id)
                 return True
             else:
-                print(f"Error: HTTP {response.status_code} - {response.text}")
+                self.logger.error("HTTP %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            print(f"Error updating glossary entry: {e}")
+            self.logger.error("Error updating glossary entry: %s", e)
             return False
 
     def delete_glossary_entry(self, glossary_id: str, entry_id: str) -> bool:
@@ -291,35 +411,217 @@ class GlossaryEntryManager:
         """
         try:
             # Construct the URL
-            url = f"{self.base_url}/{self.parent}/glossaries/{glossary_id}/glossaryEntries/{entry_id}"
+            url = self._entries_url(glossary_id, entry_id)
 
-            print(f"Deleting glossary entry: {entry_id}")
-            print(f"URL: {url}")
+            self.logger.info("Deleting glossary entry: %s", entry_id)
+            self.logger.debug("URL: %s", url)
 
             # Make the API call
-            response = requests.delete(url, headers=self._get_headers())
+            response = self.session.delete(url, headers=self._get_headers())
 
             if response.status_code == 200:
-                print(f"Deleted glossary entry: {entry_id}")
+                self.logger.info("Deleted glossary entry: %s", entry_id)
                 return True
             else:
-                print(f"Error: HTTP {response.status_code} - {response.text}")
+                self.logger.error("HTTP %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            print(f"Error deleting glossary entry: {e}")
+            self.logger.error("Error deleting glossary entry: %s", e)
             return False
 
+    def create_glossary_entries_bulk(self, glossary_id: str,
+                                     entries: List[Tuple[List[Dict[str, str]], str]],
+                                     max_workers: int = 16) -> List[Optional[str]]:
+        """
+        Create many glossary entries concurrently.
 
-def main():
-    """Main function to handle command line arguments and execute operations."""
-    # Load environment variables from .env file
-    load_dotenv()
+        Args:
+            glossary_id: The ID of the glossary
+            entries: (terms, description) pairs, as for create_glossary_entry
+            max_workers: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            The created entry IDs in input order, None for entries that failed
+        """
+        return self._run_bulk(
+            lambda entry: self.create_glossary_entry(glossary_id, entry[0], entry[1]),
+            entries, None, max_workers
+        )
+
+    def delete_glossary_entries_bulk(self, glossary_id: str, entry_ids: List[str],
+                                     max_workers: int = 16) -> List[bool]:
+        """
+        Delete many glossary entries concurrently.
+
+        Args:
+            glossary_id: The ID of the glossary
+            entry_ids: IDs of the glossary entries to delete
+            max_workers: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            True/False per entry ID in input order
+        """
+        return self._run_bulk(
+            lambda entry_id: self.delete_glossary_entry(glossary_id, entry_id),
+            entry_ids, False, max_workers
+        )
+
+    def _run_bulk(self, operation: Callable[[Any], Any], items: List[Any],
+                  failure: Any, max_workers: int) -> List[Any]:
+        """
+        Apply a single-entry operation to many items on a thread pool.
+
+        Args:
+            operation: Single-entry method call for one item
+            items: Items to process
+            failure: Result reported for every item if credentials can't be refreshed
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Results of the operation in input order
+        """
+        if not items:
+            return []
+
+        # Refresh the token once up front so workers don't all race to refresh it
+        try:
+            self._get_headers()
+        except Exception as e:
+            self.logger.error("Error refreshing credentials for bulk operation: %s", e)
+            return [failure] * len(items)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(operation, items))
+
+
+def _format_terms(entry: Dict[str, Any], indent: str) -> List[str]:
+    """
+    Render the terms of a glossary entry as table lines.
+
+    Args:
+        entry: Glossary entry as returned by the API
+        indent: Prefix for the "Terms:" heading; term lines get two more spaces
+
+    Returns:
+        Lines to print, or an empty list if the entry has no terms
+    """
+    # Handle termsSet format (multiple terms)
+    if entry.get("termsSet", {}).get("terms"):
+        terms = entry["termsSet"]["terms"]
+
+    # Handle termsPair format (source/target pair)
+    elif entry.get("termsPair"):
+        pair = entry["termsPair"]
+        terms = [term for term in (pair.get("sourceTerm"), pair.get("targetTerm")) if term]
+
+    else:
+        return []
+
+    return [f"{indent}Terms:"] + [
+        f"{indent}  {term.get('languageCode', 'unknown')}: {term.get('text', 'unknown')}"
+        for term in terms
+    ]
+
+
+def _run_list(manager: GlossaryEntryManager, args: argparse.Namespace) -> None:
+    """List glossary entries and print them in the requested format."""
+    try:
+        if args.output == "json":
+            entries = list(manager.iter_glossary_entries(args.glossary_id, args.page_size))
+            print(json.dumps(entries, indent=2))
+            return
+
+        # Print each entry as its page arrives instead of waiting for the whole glossary
+        count = 0
+        for count, entry in enumerate(manager.iter_glossary_entries(args.glossary_id, args.page_size), 1):
+            lines = [f"\nGlossary Entries for '{args.glossary_id}':", "-" * 80] if count == 1 else []
+            entry_id = entry.get("name", "").rpartition("/")[2] or f"entry-{count}"
+            lines.append(f"\n{count}. Entry ID: {entry_id}")
+            if entry.get("description"):
+                lines.append(f"   Description: {entry['description']}")
+
+            lines.extend(_format_terms(entry, "   "))
+            print("\n".join(lines))
+
+    except IncompleteListingError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not count:
+        print("No entries found.")
+
+
+def _run_get(manager: GlossaryEntryManager, args: argparse.Namespace) -> None:
+    """Get a single glossary entry and print it in the requested format."""
+    entry = manager.get_glossary_entry(args.glossary_id, args.entry_id)
 
-    # Get default values from environment variables
-    default_project_id = os.getenv("PROJECT_ID")
-    default_location = os.getenv("LOCATION", "us-central1")
+    if args.output == "json":
+        print(json.dumps(entry, indent=2) if entry else "null")
+    else:
+        if entry:
+            lines = [f"\nGlossary Entry: {args.entry_id}", "-" * 40]
+            if entry.get("description"):
+                lines.append(f"Description: {entry['description']}")
 
+            lines.extend(_format_terms(entry, ""))
+            print("\n".join(lines))
+        else:
+            print("Entry not found.")
+
+
+def _run_create(manager: GlossaryEntryManager, args: argparse.Namespace) -> None:
+    """Create a glossary entry from the parsed --terms."""
+    entry_id = manager.create_glossary_entry(
+        args.glossary_id, args.terms, args.description
+    )
+    if entry_id:
+        print(f"Successfully created entry with ID: {entry_id}")
+    else:
+        print("Failed to create entry.")
+
+
+def _run_update(manager: GlossaryEntryManager, args: argparse.Namespace) -> None:
+    """Update a glossary entry from the parsed --terms."""
+    success = manager.update_glossary_entry(
+        args.glossary_id, args.entry_id, args.terms, args.description
+    )
+    if success:
+        print("Successfully updated entry.")
+    else:
+        print("Failed to update entry.")
+
+
+def _run_delete(manager: GlossaryEntryManager, args: argparse.Namespace) -> None:
+    """Delete a glossary entry."""
+    success = manager.delete_glossary_entry(args.glossary_id, args.entry_id)
+    if success:
+        print("Successfully deleted entry.")
+    else:
+        print("Failed to delete entry.")
+
+
+# Handler for each CLI action, looked up once per invocation
+_ACTIONS = {
+    "list": _run_list,
+    "get": _run_get,
+    "create": _run_create,
+    "update": _run_update,
+    "delete": _run_delete,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser.
+
+    The parser is built once per process. It holds no environment-derived
+    defaults; run() resolves PROJECT_ID and LOCATION when it is called.
+
+    Returns:
+        The argument parser for the glossary_manager CLI
+    """
     parser = argparse.ArgumentParser(
         description="Google Cloud Translation v3 Glossary Entry Manager",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -339,16 +641,16 @@ Examples:
         """
     )
 
-    parser.add_argument("action", choices=["list", "get", "create", "update", "delete"],
+    parser.add_argument("action", choices=list(_ACTIONS),
                        help="Action to perform")
-    parser.add_argument("--project-id", default=default_project_id,
-                       help=f"Google Cloud project ID (default: {default_project_id or 'from .env file'})")
+    parser.add_argument("--project-id",
+                       help="Google Cloud project ID (default: $PROJECT_ID / .env)")
     parser.add_argument("--glossary-id", required=True,
                        help="Glossary ID")
     parser.add_argument("--auth-file", required=True,
                        help="Path to service account JSON file")
-    parser.add_argument("--location", default=default_location,
-                       help=f"Google Cloud location (default: {default_location})")
+    parser.add_argument("--location",
+                       help="Google Cloud location (default: $LOCATION / .env, else us-central1)")
     parser.add_argument("--entry-id",
                        help="Glossary entry ID (required for get, update, delete actions)")
     parser.add_argument("--terms",
@@ -356,11 +658,34 @@ Examples:
     parser.add_argument("--description", default="",
                        help="Description for the glossary entry")
     parser.add_argument("--page-size", type=int, default=100,
-                       help="Number of entries to return per page (default: 100)")
+                       help="Number of entries to request per page (default: 100)")
     parser.add_argument("--output", choices=["json", "table"],
                        default="table", help="Output format (default: table)")
+    parser.add_argument("--verbose", action="store_true",
+                       help="Also log request URLs and bodies")
+
+    return parser
+
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Validate parsed command line arguments and execute the requested action.
+
+    Args:
+        args: Arguments as returned by build_parser().parse_args()
+    """
+    parser = build_parser()
+
+    # Progress and errors go to stderr, keeping stdout for the requested output
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
-    args = parser.parse_args()
+    # Only this module's trace; urllib3 and google-auth stay at INFO
+    if args.verbose:
+        logging.getLogger(__name__).setLevel(logging.DEBUG)
+
+    # Fill in defaults from the environment, which may have been loaded from .env
+    args.project_id = args.project_id or os.getenv("PROJECT_ID")
+    args.location = args.location or os.getenv("LOCATION", "us-central1")
 
     # Validate arguments
     if not args.project_id:
@@ -372,120 +697,39 @@ Examples:
     if args.action in ["create", "update"] and not args.terms:
         parser.error(f"Action '{args.action}' requires --terms")
 
-    # Check if auth file exists
-    if not os.path.exists(args.auth_file):
-        print(f"Error: Auth file '{args.auth_file}' not found")
-        sys.exit(1)
+    # Parse --terms before loading credentials so bad input fails fast
+    if args.action in ("create", "update"):
+        try:
+            args.terms = json.loads(args.terms)
+        except json.JSONDecodeError:
+            print("Error: Invalid JSON format for --terms")
+            sys.exit(1)
 
-    # Initialize the manager
+    # Initialize the manager; a missing auth file surfaces when it is opened
     try:
         manager = GlossaryEntryManager(
             project_id=args.project_id,
             auth_file=args.auth_file,
             location=args.location
         )
+    except FileNotFoundError:
+        print(f"Error: Auth file '{args.auth_file}' not found")
+        sys.exit(1)
     except Exception as e:
         print(f"Error initializing GlossaryEntryManager: {e}")
         sys.exit(1)
 
     # Execute the requested action
-    if args.action == "list":
-        entries = manager.list_glossary_entries(args.glossary_id, args.page_size)
-
-        if args.output == "json":
-            print(json.dumps(entries, indent=2))
-        else:
-            if entries:
-                print(f"\nGlossary Entries for '{args.glossary_id}':")
-                print("-" * 80)
-                for i, entry in enumerate(entries, 1):
-                    entry_id = entry.get("name", "").split("/")[-1] if entry.get("name") else f"entry-{i}"
-                    print(f"\n{i}. Entry ID: {entry_id}")
-                    if entry.get("description"):
-                        print(f"   Description: {entry['description']}")
-
-                    # Handle termsSet format (multiple terms)
-                    if entry.get("termsSet", {}).get("terms"):
-                        print("   Terms:")
-                        for term in entry["termsSet"]["terms"]:
-                            print(f"     {term.get('languageCode', 'unknown')}: {term.get('text', 'unknown')}")
-
-                    # Handle termsPair format (source/target pair)
-                    elif entry.get("termsPair"):
-                        print("   Terms:")
-                        source = entry["termsPair"].get("sourceTerm", {})
-                        target = entry["termsPair"].get("targetTerm", {})
-                        if source:
-                            print(f"     {source.get('languageCode', 'unknown')}: {source.get('text', 'unknown')}")
-                        if target:
-                            print(f"     {target.get('languageCode', 'unknown')}: {target.get('text', 'unknown')}")
-            else:
-                print("No entries found.")
-
-    elif args.action == "get":
-        entry = manager.get_glossary_entry(args.glossary_id, args.entry_id)
-
-        if args.output == "json":
-            print(json.dumps(entry, indent=2) if entry else "null")
-        else:
-            if entry:
-                print(f"\nGlossary Entry: {args.entry_id}")
-                print("-" * 40)
-                if entry.get("description"):
-                    print(f"Description: {entry['description']}")
-
-                # Handle termsSet format (multiple terms)
-                if entry.get("termsSet", {}).get("terms"):
-                    print("Terms:")
-                    for term in entry["termsSet"]["terms"]:
-                        print(f"  {term.get('languageCode', 'unknown')}: {term.get('text', 'unknown')}")
-
-                # Handle termsPair format (source/target pair)
-                elif entry.get("termsPair"):
-                    print("Terms:")
-                    source = entry["termsPair"].get("sourceTerm", {})
-                    target = entry["termsPair"].get("targetTerm", {})
-                    if source:
-                        print(f"  {source.get('languageCode', 'unknown')}: {source.get('text', 'unknown')}")
-                    if target:
-                        print(f"  {target.get('languageCode', 'unknown')}: {target.get('text', 'unknown')}")
-            else:
-                print("Entry not found.")
+    _ACTIONS[args.action](manager, args)
 
-    elif args.action == "create":
-        try:
-            terms = json.loads(args.terms)
-            entry_id = manager.create_glossary_entry(
-                args.glossary_id, terms, args.description
-            )
-            if entry_id:
-                print(f"Successfully created entry with ID: {entry_id}")
-            else:
-                print("Failed to create entry.")
-        except json.JSONDecodeError:
-            print("Error: Invalid JSON format for --terms")
-            sys.exit(1)
 
-    elif args.action == "update":
-        try:
-            terms = json.loads(args.terms)
-            success = manager.update_glossary_entry(
-                args.glossary_id, args.entry_id, terms, args.description
-            )
-            if success:
-                print("Successfully updated entry.")
-            else:
-                print("Failed to update entry.")
-        except json.JSONDecodeError:
-            print("Error: Invalid JSON format for --terms")
-            sys.exit(1)
+def main(argv: Optional[List[str]] = None):
+    """Main function to handle command line arguments and execute operations."""
+    # Load environment variables from .env file; only the CLI needs python-dotenv
+    from dotenv import load_dotenv
+    load_dotenv()
 
-    elif args.action == "delete":
-        success = manager.delete_glossary_entry(args.glossary_id, args.entry_id)
-        if success:
-            print("Successfully deleted entry.")
-        else:
-            print("Failed to delete entry.")
+    run(build_parser().parse_args(argv))
 
 
 if __name__ == "__main__":